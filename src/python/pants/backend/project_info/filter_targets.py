@@ -121,7 +121,12 @@ class FilterSubsystem(LineOriented, GoalSubsystem):
 
     def is_specified(self) -> bool:
         """Return true if any of the options are set."""
-        return bool(self.target_type or self.address_regex or self.tag_regex or self.granularity)
+        return bool(
+            self.target_type
+            or self.address_regex
+            or self.tag_regex
+            or self.granularity != TargetGranularity.all_targets
+        )
 
 
 def compile_regex(regex: str) -> Pattern:
@@ -5,10 +5,11 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Type, TypeVar
 
 from pants.bsp.protocol import BSPHandlerMapping
-from pants.bsp.spec.base import BuildTargetIdentifier
+from pants.bsp.spec.base import BuildTargetIdentifier, Uri
 from pants.bsp.spec.resources import ResourcesItem, ResourcesParams, ResourcesResult
 from pants.bsp.util_rules.targets import (
     BSPBuildTargetInternal,
@@ -19,14 +20,16 @@ from pants.engine.fs import Workspace
 from pants.engine.internals.native_engine import EMPTY_DIGEST, Digest, MergeDigests
 from pants.engine.internals.selectors import Get, MultiGet
 from pants.engine.rules import _uncacheable_rule, collect_rules, rule
-from pants.engine.target import FieldSet, Targets
+from pants.engine.target import FieldSet, Target, Targets
 from pants.engine.unions import UnionMembership, UnionRule
-from pants.util.ordered_set import FrozenOrderedSet
+from pants.util.memo import memoized
 
 _logger = logging.getLogger(__name__)
 
 _FS = TypeVar("_FS", bound=FieldSet)
 
+_get_output_digest = attrgetter("output_digest")
+
 
 class ResourcesRequestHandlerMapping(BSPHandlerMapping):
     method_name = "buildTarget/resources"
@@ -36,42 +39,90 @@ class ResourcesRequestHandlerMapping(BSPHandlerMapping):
 
 @dataclass(frozen=True)
 class ResourcesForOneBSPTargetRequest:
-    bsp_target: BSPBuildTargetInternal
+    # NB: `dataclass(slots=True)` requires Python 3.10.
+    __slots__ = ("bsp_target_id",)
+
+    bsp_target_id: BuildTargetIdentifier
+
+
+@dataclass(frozen=True)
+class ResourcesForOneBSPTargetResult:
+    """The resources for one BSP target.
+
+    The (non-empty) output digests of the underlying `BSPResourcesResult`s are left unmerged so
+    that the caller can merge the digests for all BSP targets in a single step.
+    """
+
+    __slots__ = ("resources", "output_digests")
+
+    resources: tuple[Uri, ...]
+    output_digests: tuple[Digest, ...]
+
+
+@memoized
+def _resources_request_and_field_set_types(
+    union_membership: UnionMembership,
+) -> tuple[tuple[Type[BSPResourcesRequest], Type[FieldSet]], ...]:
+    # NB: Union membership is fixed once plugins are loaded, so this is computed once per process
+    # rather than once per BSP target.
+    return tuple(
+        (resources_request_type, resources_request_type.field_set_type)
+        for resources_request_type in union_membership.get(BSPResourcesRequest)
+    )
 
 
 @rule
 async def resources_bsp_target(
     request: ResourcesForOneBSPTargetRequest,
     union_membership: UnionMembership,
-) -> BSPResourcesResult:
-    targets = await Get(Targets, BSPBuildTargetInternal, request.bsp_target)
-    resources_request_types: FrozenOrderedSet[Type[BSPResourcesRequest]] = union_membership.get(
-        BSPResourcesRequest
-    )
-    field_sets_by_request_type: dict[Type[BSPResourcesRequest], set[FieldSet]] = defaultdict(set)
+) -> ResourcesForOneBSPTargetResult:
+    bsp_target = await Get(BSPBuildTargetInternal, BuildTargetIdentifier, request.bsp_target_id)
+    targets = await Get(Targets, BSPBuildTargetInternal, bsp_target)
+    request_and_field_set_types = _resources_request_and_field_set_types(union_membership)
+    # NB: `Targets` are already deduplicated, and each FieldSet is created at most once per target,
+    # so there is no need to pay for hashing FieldSets into a set here.
+    field_sets_by_request_type: dict[Type[BSPResourcesRequest], list[FieldSet]] = defaultdict(list)
+    # Whether a target has the `required_fields` of a FieldSet only depends on its type, so that
+    # check is done once per target type. `opt_out` may inspect field values, so it is still
+    # checked per target.
+    candidates_by_target_type: dict[
+        Type[Target], list[tuple[Type[BSPResourcesRequest], Type[FieldSet]]]
+    ] = {}
     for target in targets:
-        for resources_request_type in resources_request_types:
-            field_set_type = resources_request_type.field_set_type
-            if field_set_type.is_applicable(target):
-                field_set = field_set_type.create(target)
-                field_sets_by_request_type[resources_request_type].add(field_set)
+        candidates = candidates_by_target_type.get(type(target))
+        if candidates is None:
+            candidates = candidates_by_target_type[type(target)] = [
+                (resources_request_type, field_set_type)
+                for resources_request_type, field_set_type in request_and_field_set_types
+                if target.has_fields(field_set_type.required_fields)
+            ]
+        # Multiple request types may share a field set type: only create it once per target.
+        field_sets_by_type: dict[Type[FieldSet], FieldSet] = {}
+        for resources_request_type, field_set_type in candidates:
+            if not field_set_type.opt_out(target):
+                field_set = field_sets_by_type.get(field_set_type)
+                if field_set is None:
+                    field_set = field_sets_by_type[field_set_type] = field_set_type.create(target)
+                field_sets_by_request_type[resources_request_type].append(field_set)
 
     resources_results = await MultiGet(
         Get(
             BSPResourcesResult,
             BSPResourcesRequest,
-            resources_request_type(bsp_target=request.bsp_target, field_sets=tuple(field_sets)),
+            resources_request_type(bsp_target=bsp_target, field_sets=tuple(field_sets)),
         )
         for resources_request_type, field_sets in field_sets_by_request_type.items()
     )
 
     resources = tuple(sorted({resource for rr in resources_results for resource in rr.resources}))
 
-    output_digest = await Get(Digest, MergeDigests([rr.output_digest for rr in resources_results]))
-
-    return BSPResourcesResult(
+    return ResourcesForOneBSPTargetResult(
         resources=resources,
-        output_digest=output_digest,
+        output_digests=tuple(
+            digest
+            for digest in map(_get_output_digest, resources_results)
+            if digest != EMPTY_DIGEST
+        ),
     )
 
 
@@ -80,25 +131,19 @@ async def bsp_resources_request(
     request: ResourcesParams,
     workspace: Workspace,
 ) -> ResourcesResult:
-    bsp_targets = await MultiGet(
-        Get(BSPBuildTargetInternal, BuildTargetIdentifier, bsp_target_id)
-        for bsp_target_id in request.targets
-    )
-
     resources_results = await MultiGet(
-        Get(
-            BSPResourcesResult,
-            ResourcesForOneBSPTargetRequest(
-                bsp_target=bsp_target,
-            ),
-        )
-        for bsp_target in bsp_targets
+        Get(ResourcesForOneBSPTargetResult, ResourcesForOneBSPTargetRequest(bsp_target_id))
+        for bsp_target_id in request.targets
     )
 
     # TODO: Need to determine how resources are expected to be exposed. Directories? Individual files?
     # Initially, it looks like loose directories.
-    output_digest = await Get(Digest, MergeDigests([r.output_digest for r in resources_results]))
-    if output_digest != EMPTY_DIGEST:
+    output_digests = tuple(digest for rr in resources_results for digest in rr.output_digests)
+    if output_digests:
+        if len(output_digests) == 1:
+            output_digest = output_digests[0]
+        else:
+            output_digest = await Get(Digest, MergeDigests(output_digests))
         workspace.write_digest(output_digest, path_prefix=".pants.d/bsp")
 
     return ResourcesResult(
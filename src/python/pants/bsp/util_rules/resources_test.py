@@ -0,0 +1,106 @@
+# Copyright 2022 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from pants.base.specs import RawSpecs
+from pants.bsp.spec.base import BuildTargetIdentifier, Uri
+from pants.bsp.util_rules.resources import (
+    ResourcesForOneBSPTargetRequest,
+    ResourcesForOneBSPTargetResult,
+    resources_bsp_target,
+)
+from pants.bsp.util_rules.targets import (
+    BSPBuildTargetInternal,
+    BSPResourcesRequest,
+    BSPResourcesResult,
+    BSPTargetDefinition,
+)
+from pants.engine.addresses import Address
+from pants.engine.internals.native_engine import EMPTY_DIGEST
+from pants.engine.target import FieldSet, Target, Targets
+from pants.engine.unions import UnionMembership
+from pants.testutil.rule_runner import MockGet, run_rule_with_mocks
+
+
+class MockTarget(Target):
+    alias = "mock_target"
+    core_fields = ()
+
+
+@dataclass(frozen=True)
+class MockFieldSet(FieldSet):
+    required_fields = ()
+
+
+class MockResourcesRequestA(BSPResourcesRequest):
+    field_set_type = MockFieldSet
+
+
+class MockResourcesRequestB(BSPResourcesRequest):
+    field_set_type = MockFieldSet
+
+
+def run_resources_bsp_target(
+    resources_by_request_type: dict[type[BSPResourcesRequest], tuple[Uri, ...]]
+) -> ResourcesForOneBSPTargetResult:
+    bsp_target = BSPBuildTargetInternal(
+        name="mock",
+        specs=RawSpecs(description_of_origin="tests"),
+        definition=BSPTargetDefinition(
+            display_name=None, base_directory=None, addresses=(), resolve_filter=None
+        ),
+    )
+    union_membership = UnionMembership({BSPResourcesRequest: resources_by_request_type})
+    return run_rule_with_mocks(
+        resources_bsp_target,
+        rule_args=[ResourcesForOneBSPTargetRequest(bsp_target.bsp_target_id), union_membership],
+        mock_gets=[
+            MockGet(
+                output_type=BSPBuildTargetInternal,
+                input_types=(BuildTargetIdentifier,),
+                mock=lambda _: bsp_target,
+            ),
+            MockGet(
+                output_type=Targets,
+                input_types=(BSPBuildTargetInternal,),
+                mock=lambda _: Targets([MockTarget({}, Address("src", target_name="t"))]),
+            ),
+            MockGet(
+                output_type=BSPResourcesResult,
+                input_types=(BSPResourcesRequest,),
+                mock=lambda request: BSPResourcesResult(
+                    resources_by_request_type[type(request)], EMPTY_DIGEST
+                ),
+            ),
+        ],
+        union_membership=union_membership,
+    )
+
+
+@pytest.mark.parametrize(
+    "resources_by_request_type, expected",
+    [
+        ({}, ()),
+        ({MockResourcesRequestA: ("c", "a", "b", "a")}, ("a", "b", "c")),
+        ({MockResourcesRequestA: ("a", "b")}, ("a", "b")),
+        (
+            {MockResourcesRequestA: ("d", "b"), MockResourcesRequestB: ("c", "d", "a", "b")},
+            ("a", "b", "c", "d"),
+        ),
+        (
+            {MockResourcesRequestA: ("a", "c"), MockResourcesRequestB: ()},
+            ("a", "c"),
+        ),
+    ],
+)
+def test_resources_are_sorted_and_deduplicated(
+    resources_by_request_type: dict[type[BSPResourcesRequest], tuple[Uri, ...]],
+    expected: tuple[Uri, ...],
+) -> None:
+    result = run_resources_bsp_target(resources_by_request_type)
+    assert result.resources == expected
+    assert result.output_digests == ()
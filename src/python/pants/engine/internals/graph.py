@@ -11,7 +11,7 @@ import logging
 import os.path
 from dataclasses import dataclass
 from pathlib import PurePath
-from typing import Any, Iterable, Iterator, NamedTuple, Sequence, Type, TypeVar, cast
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Sequence, Type, TypeVar, cast
 
 from pants.base.deprecated import warn_or_error
 from pants.base.specs import AncestorGlobSpec, RawSpecsWithoutFileOwners, RecursiveGlobSpec
@@ -69,6 +69,7 @@ from pants.engine.target import (
     MultipleSourcesField,
     OverridesField,
     RegisteredTargetTypes,
+    ShouldTraverseDepsPredicate,
     SourcesField,
     SourcesPaths,
     SourcesPathsRequest,
@@ -111,25 +112,28 @@ logger = logging.getLogger(__name__)
 @rule(_masked_types=[EnvironmentName])
 async def resolve_unexpanded_targets(addresses: Addresses) -> UnexpandedTargets:
     wrapped_targets = await MultiGet(
-        Get(
-            WrappedTarget,
-            WrappedTargetRequest(
-                a,
-                # Idiomatic rules should not be manually constructing `Addresses`. Instead, they
-                # should use `UnparsedAddressInputs` or `Specs` rules.
-                #
-                # It is technically more correct for us to require callers of
-                # `Addresses -> UnexpandedTargets` to specify a `description_of_origin`. But in
-                # practice, this dramatically increases boilerplate, and it should never be
-                # necessary.
-                #
-                # Note that this contrasts with an individual `Address`, which often is unverified
-                # because it can come from the rule `AddressInput -> Address`, which only verifies
-                # that it has legal syntax and does not check the address exists.
-                description_of_origin="<infallible>",
-            ),
-        )
-        for a in addresses
+        [
+            Get(
+                WrappedTarget,
+                WrappedTargetRequest(
+                    a,
+                    # Idiomatic rules should not be manually constructing `Addresses`. Instead,
+                    # they should use `UnparsedAddressInputs` or `Specs` rules.
+                    #
+                    # It is technically more correct for us to require callers of
+                    # `Addresses -> UnexpandedTargets` to specify a `description_of_origin`. But
+                    # in practice, this dramatically increases boilerplate, and it should never be
+                    # necessary.
+                    #
+                    # Note that this contrasts with an individual `Address`, which often is
+                    # unverified because it can come from the rule `AddressInput -> Address`,
+                    # which only verifies that it has legal syntax and does not check the address
+                    # exists.
+                    description_of_origin="<infallible>",
+                ),
+            )
+            for a in addresses
+        ]
     )
     return UnexpandedTargets(wrapped_target.target for wrapped_target in wrapped_targets)
 
@@ -181,7 +185,7 @@ class _AdaptorAndType:
 @dataclass(frozen=True)
 class _RequestAdaptorAndType:
     address: Address
-    description_of_origin: str
+    description_of_origin: str = dataclasses.field(hash=False, compare=False)
 
 
 @rule
@@ -234,6 +238,8 @@ class ResolveAllTargetGeneratorRequests:
 @rule
 async def resolve_all_generator_target_requests(
     req: ResolveAllTargetGeneratorRequests,
+    registered_target_types: RegisteredTargetTypes,
+    target_types_to_generate_requests: TargetTypesToGenerateTargetsRequests,
 ) -> ResolvedTargetGeneratorRequests:
     address_families = await Get(
         AddressFamilies,
@@ -242,17 +248,74 @@ async def resolve_all_generator_target_requests(
             description_of_origin="the `ResolveAllTargetGeneratorRequests` rule",
         ),
     )
+    # The target adaptors are already at hand, so skip resolving any targets whose type cannot
+    # generate targets. NB: Unrecognized target types are still resolved, so that they error.
+    non_generator_aliases = {
+        alias
+        for alias, target_type in registered_target_types.aliases_to_types.items()
+        if not issubclass(target_type, TargetGenerator)
+        or not target_types_to_generate_requests.request_for(target_type)
+    }
+    wanted_alias = req.of_type.alias if req.of_type is not None else None
     results = await MultiGet(
-        Get(
-            ResolvedTargetGeneratorRequests,
-            ResolveTargetGeneratorRequests(address, req.description_of_origin),
-        )
-        for family in address_families
-        for address, target_adaptor in family.addresses_to_target_adaptors.items()
-        if not req.of_type or target_adaptor.type_alias == req.of_type.alias
+        [
+            Get(
+                ResolvedTargetGeneratorRequests,
+                ResolveTargetGeneratorRequests(address, req.description_of_origin),
+            )
+            for family in address_families
+            for address, target_adaptor in family.addresses_to_target_adaptors.items()
+            if (wanted_alias is None or target_adaptor.type_alias == wanted_alias)
+            and target_adaptor.type_alias not in non_generator_aliases
+        ]
     )
     return ResolvedTargetGeneratorRequests(
-        tuple(itertools.chain.from_iterable(result.requests for result in results))
+        tuple(request for result in results for request in result.requests)
+    )
+
+
+@dataclass(frozen=True)
+class _TargetGeneratorFieldTypes:
+    # The (deprecated and current) aliases of the fields which are copied to generated targets.
+    copied_field_aliases: frozenset[str]
+    # The (deprecated and current) aliases of the fields which are moved to generated targets.
+    moved_fields_by_alias: FrozenDict[str, type[Field]]
+    field_aliases: frozenset[str]
+
+
+@memoized
+def _target_generator_field_types(
+    target_type: type[TargetGenerator], union_membership: UnionMembership
+) -> _TargetGeneratorFieldTypes:
+    """The field types of a target generator depend only on its type, so are computed once."""
+    copied_fields = (
+        *target_type.copied_fields,
+        *target_type._find_copied_plugin_fields(union_membership),
+    )
+    moved_fields = (
+        *target_type.moved_fields,
+        *target_type._find_moved_plugin_fields(union_membership),
+    )
+    return _TargetGeneratorFieldTypes(
+        copied_field_aliases=frozenset(
+            alias
+            for field_type in copied_fields
+            for alias in (field_type.deprecated_alias, field_type.alias)
+            if alias is not None
+        ),
+        moved_fields_by_alias=FrozenDict(
+            {
+                alias: field_type
+                for field_type in moved_fields
+                for alias in (field_type.deprecated_alias, field_type.alias)
+                if alias is not None
+            }
+        ),
+        field_aliases=frozenset(
+            target_type._get_field_aliases_to_field_types(
+                target_type.class_field_types(union_membership)
+            )
+        ),
     )
 
 
@@ -260,9 +323,10 @@ async def _parametrized_target_generators_with_templates(
     address: Address,
     target_adaptor: TargetAdaptor,
     target_type: type[TargetGenerator],
-    generator_fields: dict[str, Any],
     union_membership: UnionMembership,
-) -> list[tuple[TargetGenerator, dict[str, Any]]]:
+) -> tuple[list[tuple[TargetGenerator, dict[str, Any]]], dict[str, Any]]:
+    """Returns the parametrized target generators with their templates, and the generator fields
+    which remain after splitting out the template fields."""
     # Pre-load field values from defaults for the target type being generated.
     if hasattr(target_type, "generated_target_cls"):
         family = await Get(AddressFamily, AddressFamilyDir(address.spec_path))
@@ -270,51 +334,31 @@ async def _parametrized_target_generators_with_templates(
     else:
         template_fields = {}
 
-    # Split out the `propagated_fields` before construction.
-    copied_fields = (
-        *target_type.copied_fields,
-        *target_type._find_copied_plugin_fields(union_membership),
-    )
-    moved_fields = (
-        *target_type.moved_fields,
-        *target_type._find_moved_plugin_fields(union_membership),
-    )
-    for field_type in copied_fields:
-        for alias in (field_type.deprecated_alias, field_type.alias):
-            if alias is None:
-                continue
-            # Any deprecated field use will be checked on the generator target.
-            field_value = generator_fields.get(alias, None)
-            if field_value is not None:
-                template_fields[alias] = field_value
-    for field_type in moved_fields:
-        # We must check for deprecated field usage here before passing the value to the generator.
-        if field_type.deprecated_alias is not None:
-            field_value = generator_fields.pop(field_type.deprecated_alias, None)
+    # Split out the `propagated_fields` before construction, in a single pass over the fields.
+    generator_field_types = _target_generator_field_types(target_type, union_membership)
+    generator_fields: dict[str, Any] = {}
+    generator_fields_parametrized = []
+    for name, field_value in target_adaptor.kwargs.items():
+        moved_field_type = generator_field_types.moved_fields_by_alias.get(name)
+        if moved_field_type is not None:
             if field_value is not None:
-                warn_deprecated_field_type(field_type)
-                template_fields[field_type.deprecated_alias] = field_value
-        field_value = generator_fields.pop(field_type.alias, None)
-        if field_value is not None:
-            template_fields[field_type.alias] = field_value
-
-    # Move parametrize groups over to `template_fields` in order to expand them.
-    parametrize_group_field_names = [
-        name
-        for name, field in generator_fields.items()
-        if isinstance(field, Parametrize) and field.is_group
-    ]
-    for field_name in parametrize_group_field_names:
-        template_fields[field_name] = generator_fields.pop(field_name)
-
-    field_type_aliases = target_type._get_field_aliases_to_field_types(
-        target_type.class_field_types(union_membership)
-    ).keys()
-    generator_fields_parametrized = {
-        name
-        for name, field in generator_fields.items()
-        if isinstance(field, Parametrize) and name in field_type_aliases
-    }
+                # We must check for deprecated field usage here before passing the value to the
+                # generator.
+                if name == moved_field_type.deprecated_alias:
+                    warn_deprecated_field_type(moved_field_type)
+                template_fields[name] = field_value
+            continue
+        if isinstance(field_value, Parametrize) and field_value.is_group:
+            # Move parametrize groups over to `template_fields` in order to expand them.
+            template_fields[name] = field_value
+            continue
+        if field_value is not None and name in generator_field_types.copied_field_aliases:
+            # Any deprecated field use will be checked on the generator target.
+            template_fields[name] = field_value
+        if isinstance(field_value, Parametrize) and name in generator_field_types.field_aliases:
+            generator_fields_parametrized.append(name)
+        generator_fields[name] = field_value
+
     if generator_fields_parametrized:
         noun = pluralize(len(generator_fields_parametrized), "field", include_count=False)
         generator_fields_parametrized_text = ", ".join(
@@ -325,7 +369,7 @@ async def _parametrized_target_generators_with_templates(
             f"so target generator {address} (with type {target_type.alias}) cannot "
             f"parametrize the {generator_fields_parametrized_text} {noun}."
         )
-    return [
+    generators = [
         (
             _create_target(
                 address,
@@ -339,6 +383,7 @@ async def _parametrized_target_generators_with_templates(
         )
         for address, template in Parametrize.expand(address, template_fields)
     ]
+    return generators, generator_fields
 
 
 async def _target_generator_overrides(
@@ -363,6 +408,17 @@ async def _target_generator_overrides(
     return overrides_flattened
 
 
+def _needs_expansion(address: Address, fields: Mapping[str, Any]) -> bool:
+    """Whether `Parametrize.expand` could produce anything other than `(address, fields)`.
+
+    Expansion can only produce new addresses if some field is parametrized, or if the address has
+    parameters to remove, so it may be skipped in the common case of neither.
+    """
+    return bool(address.parameters) or any(
+        isinstance(field_value, Parametrize) for field_value in fields.values()
+    )
+
+
 @rule
 async def resolve_generator_target_requests(
     req: ResolveTargetGeneratorRequests,
@@ -381,12 +437,10 @@ async def resolve_generator_target_requests(
     generate_request = target_types_to_generate_requests.request_for(target_type)
     if not generate_request:
         return ResolvedTargetGeneratorRequests()
-    generator_fields = dict(target_adaptor.kwargs)
-    generators = await _parametrized_target_generators_with_templates(
+    generators, generator_fields = await _parametrized_target_generators_with_templates(
         req.address,
         target_adaptor,
         target_type,
-        generator_fields,
         union_membership,
     )
     base_generator = _create_target(
@@ -404,7 +458,11 @@ async def resolve_generator_target_requests(
                 template_address=generator.address,
                 template=template,
                 overrides={
-                    name: dict(Parametrize.expand(generator.address, override))
+                    name: (
+                        dict(Parametrize.expand(generator.address, override))
+                        if _needs_expansion(generator.address, override)
+                        else {generator.address: override}
+                    )
                     for name, override in overrides.items()
                 },
             )
@@ -451,6 +509,17 @@ async def resolve_target_parametrizations(
 _TargetType = TypeVar("_TargetType", bound=Target)
 
 
+@memoized
+def _deprecated_field_types(
+    target_type: type[Target], union_membership: UnionMembership
+) -> tuple[type[Field], ...]:
+    return tuple(
+        field_type
+        for field_type in target_type.class_field_types(union_membership)
+        if field_type.deprecated_alias is not None
+    )
+
+
 def _create_target(
     address: Address,
     target_type: type[_TargetType],
@@ -471,8 +540,8 @@ def _create_target(
         description_of_origin=target_adaptor.description_of_origin,
     )
     # Check for any deprecated field usage.
-    for field_type in target.field_types:
-        if field_type.deprecated_alias is not None and field_type.deprecated_alias in field_values:
+    for field_type in _deprecated_field_types(target_type, union_membership):
+        if field_type.deprecated_alias in field_values:
             warn_deprecated_field_type(field_type)
 
     return target
@@ -484,34 +553,34 @@ def _target_parametrizations(
     target_type: type[Target],
     union_membership: UnionMembership,
 ) -> _TargetParametrization:
-    expanded_parametrizations = tuple(Parametrize.expand(address, target_adaptor.kwargs))
-    first_address, first_kwargs = expanded_parametrizations[0]
-    if first_address is not address:
-        # The target was parametrized, and so the original Target does not exist.
-        generated = FrozenDict(
-            (
-                parameterized_address,
-                _create_target(
-                    parameterized_address,
-                    target_type,
-                    target_adaptor,
-                    parameterized_fields,
-                    union_membership,
-                ),
+    if _needs_expansion(address, target_adaptor.kwargs):
+        expanded_parametrizations = tuple(Parametrize.expand(address, target_adaptor.kwargs))
+        first_address, _ = expanded_parametrizations[0]
+        if first_address is not address:
+            # The target was parametrized, and so the original Target does not exist.
+            generated = FrozenDict(
+                {
+                    parameterized_address: _create_target(
+                        parameterized_address,
+                        target_type,
+                        target_adaptor,
+                        parameterized_fields,
+                        union_membership,
+                    )
+                    for parameterized_address, parameterized_fields in expanded_parametrizations
+                }
             )
-            for parameterized_address, parameterized_fields in expanded_parametrizations
-        )
-        return _TargetParametrization(None, generated)
-    else:
-        # The target was not parametrized.
-        target = _create_target(
-            address,
-            target_type,
-            target_adaptor,
-            target_adaptor.kwargs,
-            union_membership,
-        )
-        return _TargetParametrization(target, FrozenDict())
+            return _TargetParametrization(None, generated)
+
+    # The target was not parametrized.
+    target = _create_target(
+        address,
+        target_type,
+        target_adaptor,
+        target_adaptor.kwargs,
+        union_membership,
+    )
+    return _TargetParametrization(target, FrozenDict())
 
 
 @rule(_masked_types=[EnvironmentName])
@@ -594,14 +663,20 @@ async def resolve_targets(
     # Replace all generating targets with what they generate. Otherwise, keep them. If a target
     # generator does not generate any targets, keep the target generator.
     # TODO: This method does not preserve the order of inputs.
-    expanded_targets: OrderedSet[Target] = OrderedSet()
+    # NB: Within a single run, a Target is uniquely identified by its Address, which is much cheaper
+    # to hash than the Target (and all of its field values).
+    expanded_targets: list[Target] = []
+    seen_addresses: set[Address] = set()
     generator_targets = []
     parametrizations_gets = []
+    # Whether a target is a generator only depends on its type.
+    is_generator_by_type: dict[type[Target], bool] = {}
     for tgt in targets:
-        if (
-            target_types_to_generate_requests.is_generator(tgt)
-            and not tgt.address.is_generated_target
-        ):
+        is_generator = is_generator_by_type.get(type(tgt))
+        if is_generator is None:
+            is_generator = target_types_to_generate_requests.is_generator(tgt)
+            is_generator_by_type[type(tgt)] = is_generator
+        if is_generator and not tgt.address.is_generated_target:
             generator_targets.append(tgt)
             parametrizations_gets.append(
                 Get(
@@ -618,25 +693,29 @@ async def resolve_targets(
                     },
                 )
             )
-        else:
-            expanded_targets.add(tgt)
+        elif tgt.address not in seen_addresses:
+            seen_addresses.add(tgt.address)
+            expanded_targets.append(tgt)
 
     all_generated_targets = await MultiGet(parametrizations_gets)
-    expanded_targets.update(
-        tgt
-        for generator, parametrizations in zip(generator_targets, all_generated_targets)
-        for tgt in parametrizations.generated_or_generator(generator.address)
-    )
+    for generator, parametrizations in zip(generator_targets, all_generated_targets):
+        for tgt in parametrizations.generated_or_generator(generator.address):
+            if tgt.address not in seen_addresses:
+                seen_addresses.add(tgt.address)
+                expanded_targets.append(tgt)
     return Targets(expanded_targets)
 
 
+_ALL_TARGETS_SPECS = RawSpecsWithoutFileOwners(
+    recursive_globs=(RecursiveGlobSpec(""),), description_of_origin="the `AllTargets` rule"
+)
+
+
 @rule(desc="Find all targets in the project", level=LogLevel.DEBUG, _masked_types=[EnvironmentName])
 async def find_all_targets() -> AllTargets:
     tgts = await Get(
         Targets,
-        RawSpecsWithoutFileOwners(
-            recursive_globs=(RecursiveGlobSpec(""),), description_of_origin="the `AllTargets` rule"
-        ),
+        _ALL_TARGETS_SPECS,
     )
     return AllTargets(tgts)
 
@@ -649,9 +728,7 @@ async def find_all_targets() -> AllTargets:
 async def find_all_unexpanded_targets() -> AllUnexpandedTargets:
     tgts = await Get(
         UnexpandedTargets,
-        RawSpecsWithoutFileOwners(
-            recursive_globs=(RecursiveGlobSpec(""),), description_of_origin="the `AllTargets` rule"
-        ),
+        _ALL_TARGETS_SPECS,
     )
     return AllUnexpandedTargets(tgts)
 
@@ -682,50 +759,49 @@ class CycleException(Exception):
 def _detect_cycles(
     roots: tuple[Address, ...], dependency_mapping: dict[Address, tuple[Address, ...]]
 ) -> None:
-    path_stack: OrderedSet[Address] = OrderedSet()
+    # NB: This uses an explicit stack rather than recursion, so that deep dependency graphs neither
+    # pay for a Python frame per node nor risk hitting the recursion limit.
+    path_stack: list[Address] = []
+    path_positions: dict[Address, int] = {}
     visited: set[Address] = set()
 
     def maybe_report_cycle(address: Address) -> None:
         # NB: File-level dependencies are cycle tolerant.
-        if address.is_file_target or address not in path_stack:
+        if address.is_file_target:
+            return
+        position = path_positions.get(address)
+        if position is None:
             return
 
         # The path of the cycle is shorter than the entire path to the cycle: if the suffix of
         # the path representing the cycle contains a file dep, it is ignored.
-        in_cycle = False
-        for path_address in path_stack:
-            if in_cycle and path_address.is_file_target:
-                # There is a file address inside the cycle: do not report it.
-                return
-            elif in_cycle:
-                # Not a file address.
-                continue
-            else:
-                # We're entering the suffix of the path that contains the cycle if we've reached
-                # the address in question.
-                in_cycle = path_address == address
-        # If we did not break out early, it's because there were no file addresses in the cycle.
+        if any(path_address.is_file_target for path_address in path_stack[position + 1 :]):
+            return
         raise CycleException(address, (*path_stack, address))
 
-    def visit(address: Address):
-        if address in visited:
-            maybe_report_cycle(address)
-            return
-        path_stack.add(address)
+    def push(address: Address) -> None:
+        path_positions[address] = len(path_stack)
+        path_stack.append(address)
         visited.add(address)
+        stack.append((address, iter(dependency_mapping[address])))
 
-        for dep_address in dependency_mapping[address]:
-            visit(dep_address)
-
-        path_stack.remove(address)
-
+    stack: list[tuple[Address, Iterator[Address]]] = []
     for root in roots:
-        visit(root)
-        if path_stack:
-            raise AssertionError(
-                f"The stack of visited nodes should have been empty at the end of recursion, "
-                f"but it still contained: {path_stack}"
-            )
+        if root in visited:
+            maybe_report_cycle(root)
+            continue
+        push(root)
+        while stack:
+            address, dep_addresses = stack[-1]
+            dep_address = next(dep_addresses, None)
+            if dep_address is None:
+                stack.pop()
+                path_stack.pop()
+                del path_positions[address]
+            elif dep_address in visited:
+                maybe_report_cycle(dep_address)
+            else:
+                push(dep_address)
 
 
 @dataclass(frozen=True)
@@ -739,6 +815,8 @@ class _DependencyMapping:
     mapping: FrozenDict[Address, tuple[Address, ...]]
     visited: FrozenOrderedSet[Target]
     roots_as_targets: Collection[Target]
+    # The non-empty transitive excludes (`!!` ignores) of the roots and visited targets.
+    unevaluated_transitive_excludes: tuple[UnparsedAddressInputs, ...]
 
 
 @rule
@@ -750,44 +828,48 @@ async def transitive_dependency_mapping(request: _DependencyMappingRequest) -> _
     """
     roots_as_targets = await Get(UnexpandedTargets, Addresses(request.tt_request.roots))
     visited: OrderedSet[Target] = OrderedSet()
-    queued = FrozenOrderedSet(roots_as_targets)
+    queued = list(FrozenOrderedSet(roots_as_targets))
     dependency_mapping: dict[Address, tuple[Address, ...]] = {}
+    unevaluated_transitive_excludes = []
+    should_traverse_deps_predicate = request.tt_request.should_traverse_deps_predicate
     while queued:
+        dependencies_requests = []
+        for tgt in queued:
+            dependencies = tgt.get(Dependencies)
+            dependencies_requests.append(
+                DependenciesRequest(
+                    dependencies, should_traverse_deps_predicate=should_traverse_deps_predicate
+                )
+            )
+            # Collect transitive excludes while the field is at hand, to avoid another pass over
+            # all of the targets in `transitive_targets`.
+            if dependencies.unevaluated_transitive_excludes.values:
+                unevaluated_transitive_excludes.append(dependencies.unevaluated_transitive_excludes)
         direct_dependencies: tuple[Collection[Target], ...]
         if request.expanded_targets:
             direct_dependencies = await MultiGet(  # noqa: PNT30: this is inherently sequential
-                Get(
-                    Targets,
-                    DependenciesRequest(
-                        tgt.get(Dependencies),
-                        should_traverse_deps_predicate=request.tt_request.should_traverse_deps_predicate,
-                    ),
-                )
-                for tgt in queued
+                [
+                    Get(Targets, DependenciesRequest, dependencies_request)
+                    for dependencies_request in dependencies_requests
+                ]
             )
         else:
             direct_dependencies = await MultiGet(  # noqa: PNT30: this is inherently sequential
-                Get(
-                    UnexpandedTargets,
-                    DependenciesRequest(
-                        tgt.get(Dependencies),
-                        should_traverse_deps_predicate=request.tt_request.should_traverse_deps_predicate,
-                    ),
-                )
-                for tgt in queued
+                [
+                    Get(UnexpandedTargets, DependenciesRequest, dependencies_request)
+                    for dependencies_request in dependencies_requests
+                ]
             )
 
-        dependency_mapping.update(
-            zip(
-                (t.address for t in queued),
-                (tuple(t.address for t in deps) for deps in direct_dependencies),
-            )
-        )
-
-        queued = FrozenOrderedSet(itertools.chain.from_iterable(direct_dependencies)).difference(
-            visited
-        )
-        visited.update(queued)
+        # NB: Adding each newly seen target to `visited` as we go also deduplicates the next round.
+        next_queued = []
+        for tgt, deps in zip(queued, direct_dependencies):
+            dependency_mapping[tgt.address] = tuple(dep.address for dep in deps)
+            for dep in deps:
+                if dep not in visited:
+                    visited.add(dep)
+                    next_queued.append(dep)
+        queued = next_queued
 
     # NB: We use `roots_as_targets` to get the root addresses, rather than `request.roots`. This
     # is because expanding from the `Addresses` -> `Targets` may have resulted in generated
@@ -795,7 +877,10 @@ async def transitive_dependency_mapping(request: _DependencyMappingRequest) -> _
     # TODO(#12871): Fix this to not be based on generated targets.
     _detect_cycles(tuple(t.address for t in roots_as_targets), dependency_mapping)
     return _DependencyMapping(
-        FrozenDict(dependency_mapping), FrozenOrderedSet(visited), roots_as_targets
+        FrozenDict(dependency_mapping),
+        FrozenOrderedSet(visited),
+        roots_as_targets,
+        tuple(unevaluated_transitive_excludes),
     )
 
 
@@ -812,52 +897,44 @@ async def transitive_targets(
     targets = (*dependency_mapping.roots_as_targets, *dependency_mapping.visited)
 
     # Apply any transitive excludes (`!!` ignores).
-    unevaluated_transitive_excludes = []
-    for t in targets:
-        unparsed = t.get(Dependencies).unevaluated_transitive_excludes
-        if unparsed.values:
-            unevaluated_transitive_excludes.append(unparsed)
-
-    transitive_exclude_addresses = []
+    unevaluated_transitive_excludes = dependency_mapping.unevaluated_transitive_excludes
+    transitive_exclude_addresses: list[Address] = []
     if unevaluated_transitive_excludes:
         all_transitive_exclude_addresses = await MultiGet(
             Get(Addresses, UnparsedAddressInputs, unparsed)
             for unparsed in unevaluated_transitive_excludes
         )
-        transitive_exclude_addresses = [
-            *itertools.chain.from_iterable(all_transitive_exclude_addresses)
-        ]
+        for addresses in all_transitive_exclude_addresses:
+            transitive_exclude_addresses.extend(addresses)
 
     # Apply plugin-provided transitive excludes
     if request_types := cast(
         "Sequence[Type[TransitivelyExcludeDependenciesRequest]]",
         union_membership.get(TransitivelyExcludeDependenciesRequest),
     ):
-        tgts_to_request_types = {
-            tgt: [
-                inference_request_type
-                for inference_request_type in request_types
-                if inference_request_type.infer_from.is_applicable(tgt)
-            ]
+        applicable_requests = [
+            (tgt, request_type)
+            for request_type in request_types
             for tgt in targets
-        }
+            if request_type.infer_from.is_applicable(tgt)
+        ]
 
         results = await MultiGet(
-            Get(
-                TransitivelyExcludeDependencies,
-                {
-                    request_type(
-                        request_type.infer_from.create(tgt)
-                    ): TransitivelyExcludeDependenciesRequest,
-                    environment_name: EnvironmentName,
-                },
-            )
-            for tgt, request_types in tgts_to_request_types.items()
-            for request_type in request_types
-        )
-        transitive_exclude_addresses.extend(
-            itertools.chain.from_iterable(addresses for addresses in results)
+            [
+                Get(
+                    TransitivelyExcludeDependencies,
+                    {
+                        request_type(
+                            request_type.infer_from.create(tgt)
+                        ): TransitivelyExcludeDependenciesRequest,
+                        environment_name: EnvironmentName,
+                    },
+                )
+                for tgt, request_type in applicable_requests
+            ]
         )
+        for exclude_addresses in results:
+            transitive_exclude_addresses.extend(exclude_addresses)
 
     transitive_excludes = await Get(Targets, Addresses(transitive_exclude_addresses))
 
@@ -892,7 +969,8 @@ async def coarsened_targets(
         ),
     )
     addresses_to_targets = {
-        t.address: t for t in [*dependency_mapping.visited, *dependency_mapping.roots_as_targets]
+        t.address: t
+        for t in itertools.chain(dependency_mapping.visited, dependency_mapping.roots_as_targets)
     }
 
     # Because this is Tarjan's SCC (TODO: update signature to guarantee), components are returned
@@ -903,24 +981,37 @@ async def coarsened_targets(
         list(dependency_mapping.mapping.items())
     )
 
+    # Index each address by its component, so that dependencies external to a component can be
+    # identified without building a set per component.
+    component_ids = {
+        address: component_id
+        for component_id, component in enumerate(components)
+        for address in component
+    }
+
     coarsened_targets: dict[Address, CoarsenedTarget] = {}
     root_coarsened_targets = []
     root_addresses_set = set(request.roots)
     try:
-        for component in components:
-            component = sorted(component)
-            component_set = set(component)
+        for component_id, component in enumerate(components):
+            # NB: Most components of a (mostly acyclic) dependency graph are singletons, which do
+            # not need sorting.
+            if len(component) > 1:
+                component = sorted(component)
 
             # For each member of the component, include the CoarsenedTarget for each of its external
-            # dependencies.
+            # dependencies. Members of a cycle often share dependencies, so dedupe them by their
+            # (cheaply hashed) component ids.
+            seen_component_ids = {component_id}
+            dependencies = []
+            for a in component:
+                for d in dependency_mapping.mapping[a]:
+                    dependency_component_id = component_ids[d]
+                    if dependency_component_id not in seen_component_ids:
+                        seen_component_ids.add(dependency_component_id)
+                        dependencies.append(coarsened_targets[d])
             coarsened_target = CoarsenedTarget(
-                (addresses_to_targets[a] for a in component),
-                (
-                    coarsened_targets[d]
-                    for a in component
-                    for d in dependency_mapping.mapping[a]
-                    if d not in component_set
-                ),
+                (addresses_to_targets[a] for a in component), dependencies
             )
 
             # Add to the coarsened_targets mapping under each of the component's Addresses.
@@ -928,7 +1019,7 @@ async def coarsened_targets(
                 coarsened_targets[address] = coarsened_target
 
             # If any of the input Addresses was a member of this component, it is a root.
-            if component_set & root_addresses_set:
+            if any(address in root_addresses_set for address in component):
                 root_coarsened_targets.append(coarsened_target)
     except KeyError:
         # TODO: This output is intended to help uncover a non-deterministic error reported in
@@ -999,6 +1090,13 @@ class Owners(FrozenOrderedSet[Address]):
     pass
 
 
+def _files_by_dir(files: Iterable[str]) -> dict[str, list[str]]:
+    files_by_dir: dict[str, list[str]] = {}
+    for f in files:
+        files_by_dir.setdefault(os.path.dirname(f), []).append(f)
+    return files_by_dir
+
+
 @rule(desc="Find which targets own certain files", _masked_types=[EnvironmentName])
 async def find_owners(
     owners_request: OwnersRequest,
@@ -1009,8 +1107,10 @@ async def find_owners(
 
     live_files = FrozenOrderedSet(sources_paths.files)
     deleted_files = FrozenOrderedSet(s for s in owners_request.sources if s not in live_files)
-    live_dirs = FrozenOrderedSet(os.path.dirname(s) for s in live_files)
-    deleted_dirs = FrozenOrderedSet(os.path.dirname(s) for s in deleted_files)
+    live_files_by_dir = _files_by_dir(live_files)
+    deleted_files_by_dir = _files_by_dir(deleted_files)
+    live_dirs = FrozenOrderedSet(live_files_by_dir)
+    deleted_dirs = FrozenOrderedSet(deleted_files_by_dir)
 
     def create_live_and_deleted_gets(
         *, filter_by_global_options: bool
@@ -1057,33 +1157,56 @@ async def find_owners(
         if live:
             candidate_tgts = live_candidate_tgts
             sources_set = live_files
+            sources_by_dir = live_files_by_dir
         else:
             candidate_tgts = deleted_candidate_tgts
             sources_set = deleted_files
-
-        build_file_addresses = await MultiGet(  # noqa: PNT30: requires triage
-            Get(
-                BuildFileAddress,
-                BuildFileAddressRequest(
-                    tgt.address, description_of_origin="<owners rule - cannot trigger>"
-                ),
+            sources_by_dir = deleted_files_by_dir
+
+        # NB: Targets may only own sources in their own directory or its subdirectories (as
+        # assumed by the `AncestorGlobSpec`s above), so index the sources by each of their
+        # ancestor directories to match each candidate against only the sources it could own.
+        sources_by_ancestor_dir: dict[str, list[str]] = {}
+        for directory, dir_sources in sources_by_dir.items():
+            while True:
+                sources_by_ancestor_dir.setdefault(directory, []).extend(dir_sources)
+                if not directory:
+                    break
+                directory = os.path.dirname(directory)
+
+        # NB: A target's BUILD file only matters if it owns none of the sources, so we only look
+        # BUILD files up for those targets, and only if
+        # `match_if_owning_build_file_included_in_sources` is set.
+        candidate_tgts_without_matches = []
+        for candidate_tgt in candidate_tgts:
+            candidate_sources = sources_by_ancestor_dir.get(candidate_tgt.address.spec_path)
+            matching_files = (
+                set(candidate_tgt.get(SourcesField).filespec_matcher.matches(candidate_sources))
+                if candidate_sources
+                else set()
             )
-            for tgt in candidate_tgts
+            if matching_files:
+                unmatched_sources -= matching_files
+                result.add(candidate_tgt.address)
+            elif owners_request.match_if_owning_build_file_included_in_sources:
+                candidate_tgts_without_matches.append(candidate_tgt)
+
+        if not candidate_tgts_without_matches:
+            continue
+        build_file_addresses = await MultiGet(  # noqa: PNT30: requires triage
+            [
+                Get(
+                    BuildFileAddress,
+                    BuildFileAddressRequest(
+                        tgt.address, description_of_origin="<owners rule - cannot trigger>"
+                    ),
+                )
+                for tgt in candidate_tgts_without_matches
+            ]
         )
-
-        for candidate_tgt, bfa in zip(candidate_tgts, build_file_addresses):
-            matching_files = set(
-                candidate_tgt.get(SourcesField).filespec_matcher.matches(list(sources_set))
-            )
-
-            if not matching_files and not (
-                owners_request.match_if_owning_build_file_included_in_sources
-                and bfa.rel_path in sources_set
-            ):
-                continue
-
-            unmatched_sources -= matching_files
-            result.add(candidate_tgt.address)
+        for candidate_tgt, bfa in zip(candidate_tgts_without_matches, build_file_addresses):
+            if bfa.rel_path in sources_set:
+                result.add(candidate_tgt.address)
 
     if (
         unmatched_sources
@@ -1177,20 +1300,20 @@ async def hydrate_sources(
 
     # Now, determine if any of the `for_sources_types` may be used, either because the
     # sources_field is a direct subclass or can be generated into one of the valid types.
-    def compatible_with_sources_field(valid_type: type[SourcesField]) -> bool:
-        is_instance = isinstance(sources_field, valid_type)
-        can_be_generated = (
-            request.enable_codegen
-            and generate_request_type is not None
-            and issubclass(generate_request_type.output, valid_type)
-        )
-        return is_instance or can_be_generated
-
+    generated_sources_type = (
+        generate_request_type.output
+        if request.enable_codegen and generate_request_type is not None
+        else None
+    )
     sources_type = next(
         (
             valid_type
             for valid_type in request.for_sources_types
-            if compatible_with_sources_field(valid_type)
+            if isinstance(sources_field, valid_type)
+            or (
+                generated_sources_type is not None
+                and issubclass(generated_sources_type, valid_type)
+            )
         ),
         None,
     )
@@ -1304,6 +1427,11 @@ async def determine_explicitly_provided_dependencies(
     registered_target_types: RegisteredTargetTypes,
     subproject_roots: SubprojectRoots,
 ) -> ExplicitlyProvidedDependencies:
+    if not request.field.value:
+        return ExplicitlyProvidedDependencies(
+            request.field.address, FrozenOrderedSet(), FrozenOrderedSet()
+        )
+
     parse = functools.partial(
         AddressInput.parse,
         relative_to=request.field.address.spec_path,
@@ -1315,11 +1443,11 @@ async def determine_explicitly_provided_dependencies(
 
     addresses: list[AddressInput] = []
     ignored_addresses: list[AddressInput] = []
-    for v in request.field.value or ():
-        is_ignore = v.startswith("!")
+    for v in request.field.value:
+        is_ignore = v[:1] == "!"
         if is_ignore:
             # Check if it's a transitive exclude, rather than a direct exclude.
-            if v.startswith("!!"):
+            if v[1:2] == "!":
                 if not request.field.supports_transitive_excludes:
                     raise TransitiveExcludesNotSupportedError(
                         bad_value=v,
@@ -1336,8 +1464,12 @@ async def determine_explicitly_provided_dependencies(
         else:
             addresses.append(result)
 
-    parsed_includes = await MultiGet(Get(Address, AddressInput, ai) for ai in addresses)
-    parsed_ignores = await MultiGet(Get(Address, AddressInput, ai) for ai in ignored_addresses)
+    # Resolve the includes and ignores in a single batch, and then split them back apart.
+    parsed_addresses = await MultiGet(
+        [Get(Address, AddressInput, ai) for ai in (*addresses, *ignored_addresses)]
+    )
+    parsed_includes = parsed_addresses[: len(addresses)]
+    parsed_ignores = parsed_addresses[len(addresses) :]
     return ExplicitlyProvidedDependencies(
         request.field.address,
         FrozenOrderedSet(sorted(parsed_includes)),
@@ -1348,32 +1480,193 @@ async def determine_explicitly_provided_dependencies(
 async def _fill_parameters(
     field_alias: str,
     consumer_tgt: Target,
-    addresses: Iterable[Address],
+    addresses: Sequence[Address],
     target_types_to_generate_requests: TargetTypesToGenerateTargetsRequests,
     field_defaults: FieldDefaults,
     local_environment_name: ChosenLocalEnvironmentName,
 ) -> tuple[Address, ...]:
-    assert not isinstance(addresses, Iterator)
+    # NB: Many addresses may share a target generator (e.g. the parametrizations of one target),
+    # so request the parametrizations of each generator only once.
+    address_generators = [address.maybe_convert_to_target_generator() for address in addresses]
+    generator_addresses = FrozenOrderedSet(address_generators)
+    all_parametrizations = await MultiGet(
+        [
+            Get(
+                _TargetParametrizations,
+                {
+                    _TargetParametrizationsRequest(
+                        generator_address,
+                        description_of_origin=f"the `{field_alias}` field of the target {consumer_tgt.address}",
+                    ): _TargetParametrizationsRequest,
+                    local_environment_name.val: EnvironmentName,
+                },
+            )
+            for generator_address in generator_addresses
+        ]
+    )
+    parametrizations_by_generator = dict(zip(generator_addresses, all_parametrizations))
+
+    return tuple(
+        parametrizations_by_generator[generator_address]
+        .get_subset(address, consumer_tgt, field_defaults, target_types_to_generate_requests)
+        .address
+        for address, generator_address in zip(addresses, address_generators)
+    )
+
+
+async def _explicitly_provided_dependencies(
+    tgt: Target, field: Dependencies
+) -> ExplicitlyProvidedDependencies:
+    try:
+        # NB: Request the predicate-free key directly, rather than via
+        # `convert_dependencies_request_to_explicitly_provided_dependencies_request`.
+        return await Get(
+            ExplicitlyProvidedDependencies, ExplicitlyProvidedDependenciesRequest(field)
+        )
+    except Exception as e:
+        raise InvalidFieldException(
+            f"{tgt.description_of_origin}: Failed to get dependencies for {tgt.address}: {e}"
+        )
 
-    parametrizations = await MultiGet(
+
+@memoized
+def _inference_request_types_with_required_fields(
+    target_type: type[Target], union_membership: UnionMembership
+) -> tuple[type[InferDependenciesRequest], ...]:
+    """The `InferDependenciesRequest` types whose `infer_from` field set's `required_fields` are
+    registered on the target type.
+
+    This depends only on the target type, unlike `opt_out`, so is computed once per target type.
+    """
+    inference_request_types = cast(
+        "Sequence[Type[InferDependenciesRequest]]", union_membership.get(InferDependenciesRequest)
+    )
+    return tuple(
+        inference_request_type
+        for inference_request_type in inference_request_types
+        if target_type.class_has_fields(
+            inference_request_type.infer_from.required_fields, union_membership
+        )
+    )
+
+
+async def _inferred_dependencies(
+    tgt: Target, union_membership: UnionMembership, environment_name: EnvironmentName
+) -> tuple[InferredDependencies, ...]:
+    """Infer any dependencies (based on `SourcesField` field)."""
+    inference_request_types = _inference_request_types_with_required_fields(
+        type(tgt), union_membership
+    )
+    if not inference_request_types:
+        return ()
+    relevant_inference_request_types = [
+        inference_request_type
+        for inference_request_type in inference_request_types
+        if not inference_request_type.infer_from.opt_out(tgt)
+    ]
+    return await MultiGet(
         Get(
-            _TargetParametrizations,
+            InferredDependencies,
             {
-                _TargetParametrizationsRequest(
-                    address.maybe_convert_to_target_generator(),
-                    description_of_origin=f"the `{field_alias}` field of the target {consumer_tgt.address}",
-                ): _TargetParametrizationsRequest,
-                local_environment_name.val: EnvironmentName,
+                inference_request_type(
+                    inference_request_type.infer_from.create(tgt)
+                ): InferDependenciesRequest,
+                environment_name: EnvironmentName,
             },
         )
-        for address in addresses
+        for inference_request_type in relevant_inference_request_types
+    )
+
+
+async def _generated_addresses(
+    tgt: Target,
+    target_types_to_generate_requests: TargetTypesToGenerateTargetsRequests,
+    environment_name: EnvironmentName,
+) -> tuple[Address, ...]:
+    """If it's a target generator, inject dependencies on all of its generated targets."""
+    if not target_types_to_generate_requests.is_generator(tgt) or tgt.address.is_generated_target:
+        return ()
+    generator_address = tgt.address.maybe_convert_to_target_generator()
+    parametrizations = await Get(
+        _TargetParametrizations,
+        {
+            _TargetParametrizationsRequest(
+                generator_address,
+                description_of_origin=f"the target generator {generator_address}",
+            ): _TargetParametrizationsRequest,
+            environment_name: EnvironmentName,
+        },
+    )
+    return tuple(parametrizations.generated_for(tgt.address).keys())
+
+
+@memoized
+def _special_cased_field_types(
+    target_type: type[Target], union_membership: UnionMembership
+) -> tuple[type[SpecialCasedDependencies], ...]:
+    return tuple(
+        field_type
+        for field_type in target_type.class_field_types(union_membership)
+        if issubclass(field_type, SpecialCasedDependencies)
+    )
+
+
+async def _special_cased_dependencies(
+    tgt: Target,
+    should_traverse_deps_predicate: ShouldTraverseDepsPredicate,
+    union_membership: UnionMembership,
+    subproject_roots: SubprojectRoots,
+) -> tuple[Address, ...]:
+    """If the target has `SpecialCasedDependencies`, such as the `archive` target having `files`
+    and `packages` fields, then we possibly include those too.
+
+    We don't want to always include those dependencies because they should often be excluded from
+    the result due to being handled elsewhere in the calling code. So, we only include fields based
+    on the should_traverse_deps_predicate.
+    """
+    # Unlike normal, we don't use `tgt.get()` because there may be >1 subclass of
+    # SpecialCasedDependencies. Which subclasses are registered depends only on the target type.
+    special_cased_field_types = _special_cased_field_types(type(tgt), union_membership)
+    if not special_cased_field_types:
+        return ()
+    # We can't use the normal `Get(Addresses, UnparsedAddressInputs)` due to a graph cycle.
+    return await MultiGet(
+        [
+            Get(
+                Address,
+                AddressInput,
+                AddressInput.parse(
+                    addr,
+                    relative_to=tgt.address.spec_path,
+                    subproject_roots=subproject_roots,
+                    description_of_origin=(
+                        f"the `{special_cased_field.alias}` field from the target {tgt.address}"
+                    ),
+                ),
+            )
+            for special_cased_field in (
+                tgt.field_values.get(field_type) for field_type in special_cased_field_types
+            )
+            if isinstance(special_cased_field, SpecialCasedDependencies)
+            and should_traverse_deps_predicate(tgt, special_cased_field)
+            == DepsTraversalBehavior.INCLUDE
+            for addr in special_cased_field.to_unparsed_address_inputs().values
+        ]
     )
 
+
+@memoized
+def _validate_dependencies_request_types_with_required_fields(
+    target_type: type[Target], union_membership: UnionMembership
+) -> tuple[type[ValidateDependenciesRequest], ...]:
+    """Like `_inference_request_types_with_required_fields`, but for `ValidateDependenciesRequest`
+    types."""
     return tuple(
-        parametrizations.get_subset(
-            address, consumer_tgt, field_defaults, target_types_to_generate_requests
-        ).address
-        for address, parametrizations in zip(addresses, parametrizations)
+        vd_request_type
+        for vd_request_type in union_membership.get(ValidateDependenciesRequest)
+        if target_type.class_has_fields(
+            vd_request_type.field_set_type.required_fields, union_membership  # type: ignore[misc]
+        )
     )
 
 
@@ -1400,147 +1693,93 @@ async def resolve_dependencies(
     if request.should_traverse_deps_predicate(tgt, request.field) == DepsTraversalBehavior.EXCLUDE:
         return Addresses([])
 
-    try:
-        explicitly_provided = await Get(
-            ExplicitlyProvidedDependencies, DependenciesRequest, request
-        )
-    except Exception as e:
-        raise InvalidFieldException(
-            f"{tgt.description_of_origin}: Failed to get dependencies for {tgt.address}: {e}"
-        )
-
-    # Infer any dependencies (based on `SourcesField` field).
-    inference_request_types = cast(
-        "Sequence[Type[InferDependenciesRequest]]", union_membership.get(InferDependenciesRequest)
+    # NB: None of these depend on one another, so they are requested concurrently.
+    explicitly_provided, inferred, generated_addresses, special_cased = await MultiGet(
+        _explicitly_provided_dependencies(tgt, request.field),
+        _inferred_dependencies(tgt, union_membership, environment_name),
+        _generated_addresses(tgt, target_types_to_generate_requests, environment_name),
+        _special_cased_dependencies(
+            tgt, request.should_traverse_deps_predicate, union_membership, subproject_roots
+        ),
     )
-    inferred: tuple[InferredDependencies, ...] = ()
-    if inference_request_types:
-        relevant_inference_request_types = [
-            inference_request_type
-            for inference_request_type in inference_request_types
-            if inference_request_type.infer_from.is_applicable(tgt)
-        ]
-        inferred = await MultiGet(
-            Get(
-                InferredDependencies,
-                {
-                    inference_request_type(
-                        inference_request_type.infer_from.create(tgt)
-                    ): InferDependenciesRequest,
-                    environment_name: EnvironmentName,
-                },
-            )
-            for inference_request_type in relevant_inference_request_types
-        )
-
-    # If it's a target generator, inject dependencies on all of its generated targets.
-    generated_addresses: tuple[Address, ...] = ()
-    if target_types_to_generate_requests.is_generator(tgt) and not tgt.address.is_generated_target:
-        parametrizations = await Get(
-            _TargetParametrizations,
-            {
-                _TargetParametrizationsRequest(
-                    tgt.address.maybe_convert_to_target_generator(),
-                    description_of_origin=(
-                        f"the target generator {tgt.address.maybe_convert_to_target_generator()}"
-                    ),
-                ): _TargetParametrizationsRequest,
-                environment_name: EnvironmentName,
-            },
-        )
-        generated_addresses = tuple(parametrizations.generated_for(tgt.address).keys())
 
     # See whether any explicitly provided dependencies are parametrized, but with partial/no
-    # parameters. If so, fill them in.
+    # parameters. If so, fill them in. The includes and ignores are filled in a single batch.
     explicitly_provided_includes: Iterable[Address] = explicitly_provided.includes
-    if explicitly_provided_includes:
-        explicitly_provided_includes = await _fill_parameters(
+    explicitly_provided_ignores: FrozenOrderedSet[Address] = explicitly_provided.ignores
+    if explicitly_provided_includes or explicitly_provided_ignores:
+        filled_addresses = await _fill_parameters(
             request.field.alias,
             tgt,
-            explicitly_provided_includes,
+            (*explicitly_provided.includes, *explicitly_provided.ignores),
             target_types_to_generate_requests,
             field_defaults,
             local_environment_name,
         )
-    explicitly_provided_ignores: FrozenOrderedSet[Address] = explicitly_provided.ignores
-    if explicitly_provided_ignores:
-        explicitly_provided_ignores = FrozenOrderedSet(
-            await _fill_parameters(
-                request.field.alias,
-                tgt,
-                tuple(explicitly_provided_ignores),
-                target_types_to_generate_requests,
-                field_defaults,
-                local_environment_name,
-            )
-        )
-
-    # If the target has `SpecialCasedDependencies`, such as the `archive` target having
-    # `files` and `packages` fields, then we possibly include those too. We don't want to always
-    # include those dependencies because they should often be excluded from the result due to
-    # being handled elsewhere in the calling code. So, we only include fields based on
-    # the should_traverse_deps_predicate.
-
-    # Unlike normal, we don't use `tgt.get()` because there may be >1 subclass of
-    # SpecialCasedDependencies.
-    special_cased_fields = tuple(
-        field
-        for field in tgt.field_values.values()
-        if isinstance(field, SpecialCasedDependencies)
-        and request.should_traverse_deps_predicate(tgt, field) == DepsTraversalBehavior.INCLUDE
-    )
-    # We can't use the normal `Get(Addresses, UnparsedAddressInputs)` due to a graph cycle.
-    special_cased = await MultiGet(
-        Get(
-            Address,
-            AddressInput,
-            AddressInput.parse(
-                addr,
-                relative_to=tgt.address.spec_path,
-                subproject_roots=subproject_roots,
-                description_of_origin=(
-                    f"the `{special_cased_field.alias}` field from the target {tgt.address}"
-                ),
-            ),
-        )
-        for special_cased_field in special_cased_fields
-        for addr in special_cased_field.to_unparsed_address_inputs().values
-    )
-
-    excluded = explicitly_provided_ignores.union(
-        *itertools.chain(deps.exclude for deps in inferred)
-    )
+        num_includes = len(explicitly_provided.includes)
+        explicitly_provided_includes = filled_addresses[:num_includes]
+        explicitly_provided_ignores = FrozenOrderedSet(filled_addresses[num_includes:])
+
+    # NB: `excluded` is only used for membership, so it need not be ordered. Inference rarely
+    # excludes anything, in which case the explicitly provided ignores are used as is.
+    excluded: FrozenOrderedSet[Address] | set[Address] = explicitly_provided_ignores
+    if any(deps.exclude for deps in inferred):
+        excluded = set(explicitly_provided_ignores)
+        for deps in inferred:
+            excluded.update(deps.exclude)
     result = Addresses(
         sorted(
             {
                 addr
-                for addr in (
-                    *generated_addresses,
-                    *explicitly_provided_includes,
-                    *itertools.chain.from_iterable(deps.include for deps in inferred),
-                    *special_cased,
+                for addr in itertools.chain(
+                    generated_addresses,
+                    explicitly_provided_includes,
+                    *(deps.include for deps in inferred),
+                    special_cased,
                 )
                 if addr not in excluded
             }
         )
     )
 
-    # Validate dependencies.
-    _ = await MultiGet(
-        Get(
-            ValidatedDependencies,
-            {
-                vd_request_type(vd_request_type.field_set_type.create(tgt), result): ValidateDependenciesRequest,  # type: ignore[misc]
-                environment_name: EnvironmentName,
-            },
+    # Validate dependencies, if any validators apply to the target.
+    vd_request_types = [
+        vd_request_type
+        for vd_request_type in _validate_dependencies_request_types_with_required_fields(
+            type(tgt), union_membership
+        )
+        if not vd_request_type.field_set_type.opt_out(tgt)  # type: ignore[misc]
+    ]
+    if vd_request_types:
+        _ = await MultiGet(
+            Get(
+                ValidatedDependencies,
+                {
+                    vd_request_type(vd_request_type.field_set_type.create(tgt), result): ValidateDependenciesRequest,  # type: ignore[misc]
+                    environment_name: EnvironmentName,
+                },
+            )
+            for vd_request_type in vd_request_types
         )
-        for vd_request_type in union_membership.get(ValidateDependenciesRequest)
-        if vd_request_type.field_set_type.is_applicable(tgt)  # type: ignore[misc]
-    )
 
     return result
 
 
+async def _resolve_and_validate_address(
+    address_input: AddressInput, description_of_origin: str
+) -> Address:
+    address = await Get(Address, AddressInput, address_input)
+    # Validate that the address exists. We do this eagerly here because
+    # `Addresses -> UnexpandedTargets` does not preserve the `description_of_origin`, so it would
+    # be too late, per https://github.com/pantsbuild/pants/issues/15858. Doing so per address lets
+    # validation overlap with the resolution of other addresses.
+    await Get(
+        WrappedTarget,
+        WrappedTargetRequest(address, description_of_origin=description_of_origin),
+    )
+    return address
+
+
 @rule(desc="Resolve addresses")
 async def resolve_unparsed_address_inputs(
     request: UnparsedAddressInputs, subproject_roots: SubprojectRoots
@@ -1584,16 +1823,8 @@ async def resolve_unparsed_address_inputs(
             )
         return Addresses(valid_addresses)
 
-    addresses = await MultiGet(Get(Address, AddressInput, ai) for ai in address_inputs)
-    # Validate that the addresses exist. We do this eagerly here because
-    # `Addresses -> UnexpandedTargets` does not preserve the `description_of_origin`, so it would
-    # be too late, per https://github.com/pantsbuild/pants/issues/15858.
-    await MultiGet(
-        Get(
-            WrappedTarget,
-            WrappedTargetRequest(addr, description_of_origin=request.description_of_origin),
-        )
-        for addr in addresses
+    addresses = await MultiGet(
+        [_resolve_and_validate_address(ai, request.description_of_origin) for ai in address_inputs]
     )
     return Addresses(addresses)
 
@@ -1641,35 +1872,42 @@ class GenerateFileTargets(GenerateTargetsRequest):
     generate_from = TargetFilesGenerator
 
 
-@rule
-async def generate_file_targets(
-    request: GenerateFileTargets,
-    union_membership: UnionMembership,
-) -> GeneratedTargets:
+async def _target_files_generator_sources_paths(generator: TargetFilesGenerator) -> SourcesPaths:
     try:
-        sources_paths = await Get(
-            SourcesPaths, SourcesPathsRequest(request.generator[MultipleSourcesField])
-        )
+        return await Get(SourcesPaths, SourcesPathsRequest(generator[MultipleSourcesField]))
     except Exception as e:
-        tgt = request.generator
-        fld = tgt[MultipleSourcesField]
+        fld = generator[MultipleSourcesField]
         raise InvalidFieldException(
             softwrap(
                 f"""
-                {tgt.description_of_origin}: Invalid field value for {fld.alias!r} in target {tgt.address}:
+                {generator.description_of_origin}: Invalid field value for {fld.alias!r} in target {generator.address}:
                 {e}
                 """
             )
         ) from e
 
-    add_dependencies_on_all_siblings = False
-    if request.generator.settings_request_cls:
-        generator_settings = await Get(
-            TargetFilesGeneratorSettings,
-            TargetFilesGeneratorSettingsRequest,
-            request.generator.settings_request_cls(),
-        )
-        add_dependencies_on_all_siblings = generator_settings.add_dependencies_on_all_siblings
+
+async def _add_dependencies_on_all_siblings(generator: TargetFilesGenerator) -> bool:
+    if not generator.settings_request_cls:
+        return False
+    generator_settings = await Get(
+        TargetFilesGeneratorSettings,
+        TargetFilesGeneratorSettingsRequest,
+        generator.settings_request_cls(),
+    )
+    return generator_settings.add_dependencies_on_all_siblings
+
+
+@rule
+async def generate_file_targets(
+    request: GenerateFileTargets,
+    union_membership: UnionMembership,
+) -> GeneratedTargets:
+    # NB: The sources and the generator settings are independent, so are requested concurrently.
+    sources_paths, add_dependencies_on_all_siblings = await MultiGet(
+        _target_files_generator_sources_paths(request.generator),
+        _add_dependencies_on_all_siblings(request.generator),
+    )
 
     return _generate_file_level_targets(
         type(request.generator).generated_target_cls,
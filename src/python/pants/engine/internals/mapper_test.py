@@ -223,3 +223,23 @@ def test_specs_filter() -> None:
     assert matches(tagged_tgt) is True
     assert matches(untagged_tgt) is False
     assert matches(tgt2) is False
+
+
+def test_specs_filter_unspecified() -> None:
+    class MockTgt(Target):
+        alias = "tgt"
+        core_fields = (Tags,)
+
+    specs_filter = SpecsFilter.create(
+        create_goal_subsystem(
+            FilterSubsystem,
+            target_type=[],
+            tag_regex=[],
+            address_regex=[],
+            granularity=TargetGranularity.all_targets,
+        ),
+        RegisteredTargetTypes({"tgt": MockTgt}),
+        tags=[],
+    )
+    assert specs_filter.is_specified is False
+    assert specs_filter.matches(MockTgt({Tags.alias: ["a"]}, Address("", target_name="t"))) is True
@@ -148,9 +148,11 @@ async def address_families_from_raw_specs_without_file_owners(
             SyntheticTargetsSpecPaths, SyntheticTargetsSpecPathsRequest(tuple(specs.glob_specs()))
         )
     )
-    dirnames.update(os.path.dirname(f) for f in build_file_paths.files)
+    # NB: The engine's paths are normalized and `/`-separated, so this is equivalent to (but
+    # cheaper than) `os.path.dirname`.
+    dirnames.update(f.rpartition("/")[0] for f in build_file_paths.files)
     return AddressFamilies(
-        await MultiGet(Get(AddressFamily, AddressFamilyDir(d)) for d in dirnames)
+        await MultiGet([Get(AddressFamily, AddressFamilyDir(d)) for d in dirnames])
     )
 
 
@@ -278,7 +280,9 @@ async def resolve_addresses_from_specs(specs: Specs) -> Addresses:
 
 @rule(_masked_types=[EnvironmentName])
 def filter_targets(targets: Targets, specs_filter: SpecsFilter) -> FilteredTargets:
-    return FilteredTargets(tgt for tgt in targets if specs_filter.matches(tgt))
+    if not specs_filter.is_specified:
+        return FilteredTargets(targets)
+    return FilteredTargets([tgt for tgt in targets if specs_filter.matches(tgt)])
 
 
 @rule
@@ -25,12 +25,11 @@ def create_options_bootstrapper(
 def create_option_value_container(
     default_rank: Rank = Rank.NONE, **options: RankedValue | Value
 ) -> OptionValueContainer:
-    scoped_options = OptionValueContainerBuilder()
-    for key, value in options.items():
-        if not isinstance(value, RankedValue):
-            value = RankedValue(default_rank, value)
-        setattr(scoped_options, key, value)
-    return scoped_options.build()
+    value_map = {
+        key: value if isinstance(value, RankedValue) else RankedValue(default_rank, value)
+        for key, value in options.items()
+    }
+    return OptionValueContainerBuilder(value_map).build()
 
 
 _GS = TypeVar("_GS", bound=GoalSubsystem)
@@ -31,7 +31,6 @@ from pants.init.extension_loader import (
     load_plugins,
 )
 from pants.option.subsystem import Subsystem
-from pants.util.frozendict import FrozenDict
 from pants.util.ordered_set import FrozenOrderedSet
 
 
@@ -114,31 +113,31 @@ class LoaderTest(unittest.TestCase):
         self.assertFalse(package_name in sys.modules)
 
         package_module = types.ModuleType(package_name)
-        sys.modules[package_name] = package_module
+        register_module_fqn = f"{package_name}.{module_name}"
+        register_module = types.ModuleType(register_module_fqn)
+        setattr(package_module, module_name, register_module)
+
+        for function_name, function in (
+            ("build_file_aliases", build_file_aliases),
+            ("rules", rules),
+            ("target_types", target_types),
+        ):
+            if function:
+                setattr(register_module, function_name, function)
+
+        sys.modules.update({package_name: package_module, register_module_fqn: register_module})
         try:
-            register_module_fqn = f"{package_name}.{module_name}"
-            register_module = types.ModuleType(register_module_fqn)
-            setattr(package_module, module_name, register_module)
-            sys.modules[register_module_fqn] = register_module
-
-            def register_entrypoint(function_name, function):
-                if function:
-                    setattr(register_module, function_name, function)
-
-            register_entrypoint("build_file_aliases", build_file_aliases)
-            register_entrypoint("rules", rules)
-            register_entrypoint("target_types", target_types)
-
             yield package_name
         finally:
-            del sys.modules[package_name]
+            for fqn in (package_name, register_module_fqn):
+                sys.modules.pop(fqn, None)
 
     def assert_empty(self):
         build_configuration = self.bc_builder.create()
         registered_aliases = build_configuration.registered_aliases
         self.assertEqual(0, len(registered_aliases.objects))
         self.assertEqual(0, len(registered_aliases.context_aware_object_factories))
-        self.assertEqual(build_configuration.subsystem_to_providers, FrozenDict())
+        self.assertEqual(0, len(build_configuration.subsystem_to_providers))
         self.assertEqual(0, len(build_configuration.rules))
         self.assertEqual(0, len(build_configuration.target_types))
 
@@ -173,16 +172,16 @@ class LoaderTest(unittest.TestCase):
         with self.assertRaises(PluginNotFound):
             self.load_plugins(["Foobar"])
 
-    @staticmethod
     def get_mock_plugin(
-        name, version, reg=None, alias=None, after=None, rules=None, target_types=None
+        self, name, version, reg=None, alias=None, after=None, rules=None, target_types=None
     ):
         """Make a fake Distribution (optionally with entry points)
 
         Note the entry points do not actually point to code in the returned distribution --
         the distribution does not even have a location and does not contain any code, just metadata.
 
-        A module is synthesized on the fly and installed into sys.modules under a random name.
+        A module is synthesized on the fly and installed into sys.modules under a random name until
+        the end of the test.
         If optional entry point callables are provided, those are added as methods to the module and
         their name (foo/bar/baz in fake module) is added as the requested entry point to the mocked
         metadata added to the returned dist.
@@ -198,11 +197,12 @@ class LoaderTest(unittest.TestCase):
 
         plugin_pkg = f"demoplugin{uuid.uuid4().hex}"
         pkg = types.ModuleType(plugin_pkg)
-        sys.modules[plugin_pkg] = pkg
         module_name = f"{plugin_pkg}.demo"
         plugin = types.ModuleType(module_name)
         setattr(pkg, "demo", plugin)
-        sys.modules[module_name] = plugin
+        sys.modules.update({plugin_pkg: pkg, module_name: plugin})
+        for fqn in (plugin_pkg, module_name):
+            self.addCleanup(sys.modules.pop, fqn, None)
 
         metadata = {}
         entry_lines = []